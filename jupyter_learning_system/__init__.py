@@ -6,10 +6,18 @@ __version__ = "0.1.0"
 __author__ = "Justin Crawford"
 __description__ = "Educational notebook generation system for kids"
 
-from jupyter_learning_system.generators.notebook_generator import NotebookGenerator
-from jupyter_learning_system.curriculum.curriculum_manager import CurriculumManager
-from jupyter_learning_system.progress.tracker import ProgressTracker
-from jupyter_learning_system.gamification.badges import BadgeSystem
+import importlib
+
+# Public names are imported on first access (PEP 562) so importing the
+# package does not load every submodule up front
+_LAZY_IMPORTS = {
+    "NotebookGenerator": "jupyter_learning_system.generators.notebook_generator",
+    "CurriculumManager": "jupyter_learning_system.curriculum.curriculum_manager",
+    "Lesson": "jupyter_learning_system.curriculum.curriculum_manager",
+    "LevelDifficulty": "jupyter_learning_system.curriculum.curriculum_manager",
+    "ProgressTracker": "jupyter_learning_system.progress.tracker",
+    "BadgeSystem": "jupyter_learning_system.gamification.badges",
+}
 
 __all__ = [
     "NotebookGenerator",
@@ -17,3 +25,15 @@ __all__ = [
     "ProgressTracker",
     "BadgeSystem",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
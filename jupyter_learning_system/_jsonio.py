@@ -0,0 +1,44 @@
+﻿"""
+JSON encoding shared by the notebook, curriculum and progress exports.
+Uses orjson when it is installed and reusable stdlib encoders otherwise;
+both write non-ASCII text as UTF-8.
+"""
+
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Size of the write buffer used when streaming exports to disk
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def encode_default(obj: Any) -> Any:
+    """JSON ``default`` hook expanding objects via to_dict; sets become sorted lists."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+# Reusable stdlib encoders for when orjson is not installed
+ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, check_circular=False,
+                           separators=(',', ': '), default=encode_default)
+COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, check_circular=False,
+                                   separators=(',', ':'), default=encode_default)
+
+
+def dumps(obj: Any, pretty: bool = True) -> bytes:
+    """Encode an object as JSON bytes, indented by two spaces if ``pretty``."""
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATACLASS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=encode_default, option=option)
+    encoder = ENCODER if pretty else COMPACT_ENCODER
+    return encoder.encode(obj).encode('utf-8')
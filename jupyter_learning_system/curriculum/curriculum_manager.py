@@ -1,149 +1,185 @@
-﻿\"\"\"
+﻿"""
 CurriculumManager: Manages lesson progression, dependencies, and curriculum structure.
 Organizes lessons into coherent learning paths with prerequisites and sequencing.
-\"\"\"
+"""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
-import json
+from collections import defaultdict
 from pathlib import Path
 
+from jupyter_learning_system._jsonio import WRITE_BUFFER_SIZE, dumps
+
 
 class LevelDifficulty(Enum):
-    \"\"\"Difficulty levels for lessons.\"\"\"
+    """Difficulty levels for lessons."""
     BEGINNER = 1
     INTERMEDIATE = 2
     ADVANCED = 3
 
 
-@dataclass
+_DIFFICULTY_NAMES = {d: d.name for d in LevelDifficulty}
+
+
+@dataclass(frozen=True, slots=True)
 class Lesson:
-    \"\"\"Represents a single lesson in the curriculum.\"\"\"
+    """Represents a single lesson in the curriculum.
+
+    Lessons are immutable; list arguments are stored as tuples.
+    """
     id: str
     title: str
     description: str
     topic: str
     difficulty: LevelDifficulty
     estimated_duration_minutes: int = 15
-    prerequisites: List[str] = field(default_factory=list)
-    learning_outcomes: List[str] = field(default_factory=list)
-    tags: List[str] = field(default_factory=list)
+    prerequisites: Tuple[str, ...] = ()
+    learning_outcomes: Tuple[str, ...] = ()
+    tags: Tuple[str, ...] = ()
     gamification_points: int = 100
     
+    def __post_init__(self):
+        for name in ("prerequisites", "learning_outcomes", "tags"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "title": self.title,
             "description": self.description,
             "topic": self.topic,
-            "difficulty": self.difficulty.name,
+            "difficulty": _DIFFICULTY_NAMES[self.difficulty],
             "estimated_duration_minutes": self.estimated_duration_minutes,
-            "prerequisites": self.prerequisites,
-            "learning_outcomes": self.learning_outcomes,
-            "tags": self.tags,
+            "prerequisites": list(self.prerequisites),
+            "learning_outcomes": list(self.learning_outcomes),
+            "tags": list(self.tags),
             "gamification_points": self.gamification_points,
         }
 
 
 @dataclass
 class Module:
-    \"\"\"Groups related lessons into a module.\"\"\"
+    """Groups related lessons into a module."""
     id: str
     title: str
     description: str
     lessons: List[Lesson] = field(default_factory=list)
     
     def add_lesson(self, lesson: Lesson) -> 'Module':
-        \"\"\"Add a lesson to this module.\"\"\"
+        """Add a lesson to this module."""
         self.lessons.append(lesson)
         return self
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert module to the dictionary written by export_curriculum."""
+        return {
+            "title": self.title,
+            "description": self.description,
+            "lessons": [lesson.to_dict() for lesson in self.lessons],
+        }
 
 
 class CurriculumManager:
-    \"\"\"Manages the overall curriculum structure and lesson progression.\"\"\"
+    """Manages the overall curriculum structure and lesson progression."""
     
     def __init__(self, name: str = "Kid's Learning Curriculum"):
         self.name = name
         self.modules: Dict[str, Module] = {}
         self.lessons: Dict[str, Lesson] = {}
-        self.lesson_graph: Dict[str, List[str]] = {}  # dependency graph
+        self.lesson_graph: Dict[str, Tuple[str, ...]] = {}  # dependency graph
+        # Secondary indexes for the filter queries
+        self._by_difficulty: Dict[LevelDifficulty, List[Lesson]] = defaultdict(list)
+        self._by_topic: Dict[str, List[Lesson]] = defaultdict(list)
     
     def create_module(self, module_id: str, title: str, description: str) -> Module:
-        \"\"\"Create a new module.\"\"\"
+        """Create a new module."""
         module = Module(id=module_id, title=title, description=description)
         self.modules[module_id] = module
         return module
     
     def add_lesson(self, module_id: str, lesson: Lesson) -> None:
-        \"\"\"Add a lesson to a module.\"\"\"
+        """Add a lesson to a module."""
         if module_id not in self.modules:
             raise ValueError(f"Module {module_id} not found")
         
         self.modules[module_id].add_lesson(lesson)
+        
+        replaced = self.lessons.get(lesson.id)
+        if replaced is not None:
+            self._by_difficulty[replaced.difficulty].remove(replaced)
+            self._by_topic[replaced.topic].remove(replaced)
         self.lessons[lesson.id] = lesson
+        self._by_difficulty[lesson.difficulty].append(lesson)
+        self._by_topic[lesson.topic].append(lesson)
         
         # Initialize dependency tracking
         if lesson.id not in self.lesson_graph:
             self.lesson_graph[lesson.id] = lesson.prerequisites
     
     def get_learning_path(self, start_lesson_id: str) -> List[str]:
-        \"\"\"Get a recommended learning path starting from a lesson.\"\"\"
+        """Get a recommended learning path starting from a lesson."""
         path = []
         visited = set()
+        # Iterative depth-first traversal: each entry is (lesson_id, expanded).
+        # A lesson is appended once all of its prerequisites have been emitted.
+        stack = [(start_lesson_id, False)]
         
-        def traverse(lesson_id: str):
+        while stack:
+            lesson_id, expanded = stack.pop()
+            if expanded:
+                path.append(lesson_id)
+                continue
             if lesson_id in visited:
-                return
+                continue
             visited.add(lesson_id)
             
-            if lesson_id in self.lessons:
-                # Visit prerequisites first
-                lesson = self.lessons[lesson_id]
-                for prereq in lesson.prerequisites:
-                    traverse(prereq)
-            
-            path.append(lesson_id)
+            stack.append((lesson_id, True))
+            lesson = self.lessons.get(lesson_id)
+            if lesson is not None:
+                # Visit prerequisites first, in declaration order
+                stack.extend((prereq, False) for prereq in reversed(lesson.prerequisites))
         
-        traverse(start_lesson_id)
         return path
     
     def get_lesson_by_id(self, lesson_id: str) -> Optional[Lesson]:
-        \"\"\"Retrieve a lesson by ID.\"\"\"
+        """Retrieve a lesson by ID."""
         return self.lessons.get(lesson_id)
     
+    def __contains__(self, lesson_id: str) -> bool:
+        """Check whether a lesson ID is part of the curriculum."""
+        return lesson_id in self.lessons
+    
+    def __getitem__(self, lesson_id: str) -> Lesson:
+        """Retrieve a lesson by ID, raising KeyError if it does not exist."""
+        return self.lessons[lesson_id]
+    
     def get_lessons_by_difficulty(self, difficulty: LevelDifficulty) -> List[Lesson]:
-        \"\"\"Get all lessons of a specific difficulty level.\"\"\"
-        return [l for l in self.lessons.values() if l.difficulty == difficulty]
+        """Get all lessons of a specific difficulty level."""
+        return list(self._by_difficulty.get(difficulty, ()))
     
     def get_lessons_by_topic(self, topic: str) -> List[Lesson]:
-        \"\"\"Get all lessons for a specific topic.\"\"\"
-        return [l for l in self.lessons.values() if l.topic == topic]
+        """Get all lessons for a specific topic."""
+        return list(self._by_topic.get(topic, ()))
     
     def export_curriculum(self, filepath: str) -> str:
-        \"\"\"Export curriculum structure to JSON.\"\"\"
-        curriculum_data = {
-            "name": self.name,
-            "modules": {
-                m_id: {
-                    "title": mod.title,
-                    "description": mod.description,
-                    "lessons": [les.to_dict() for les in mod.lessons]
-                }
-                for m_id, mod in self.modules.items()
-            }
-        }
-        
+        """Export curriculum structure to JSON."""
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(curriculum_data, f, indent=2)
+        # Write one module at a time so only a single module is ever held in
+        # serialized form; the output matches an indent=2 dump of the whole
+        with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(b'{\n  "name": ' + dumps(self.name) + b',\n  "modules": {')
+            for i, (m_id, mod) in enumerate(self.modules.items()):
+                f.write(b',\n    ' if i else b'\n    ')
+                f.write(dumps(str(m_id)) + b': ' + dumps(mod).replace(b'\n', b'\n    '))
+            f.write(b'\n  }\n}' if self.modules else b'}\n}')
         
         return str(path.absolute())
     
     def get_curriculum_overview(self) -> Dict[str, Any]:
-        \"\"\"Get a summary of the curriculum.\"\"\"
+        """Get a summary of the curriculum."""
         return {
             "name": self.name,
             "total_modules": len(self.modules),
@@ -4,41 +4,119 @@ Converts lesson templates into interactive, kid-friendly notebooks with code cel
 quizzes, and visual elements.
 """
 
-import json
-import uuid
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
+from datetime import date
 from pathlib import Path
+from types import MappingProxyType
+
+from jupyter_learning_system import _jsonio
+
+# Cell tags, interned so every generated cell shares the same string objects
+TAG_QUIZ = sys.intern("quiz")
+TAG_QUIZ_ANSWER = sys.intern("quiz-answer")
+TAG_CHALLENGE = sys.intern("challenge")
+TAG_CHALLENGE_CODE = sys.intern("challenge-code")
+TAG_VISUAL_EXERCISE = sys.intern("visual-exercise")
+TAG_VISUAL_CODE = sys.intern("visual-code")
+TAG_FUN_FACT = sys.intern("fun-fact")
+
+# Markdown templates for the generated cells, built once at import time
+_QUIZ_TEMPLATE = """## 🎯 Quiz Question
+
+**{question}**
+
+{options}"""
+_OPTION_LETTERS = tuple(chr(65 + i) for i in range(26))
+_QUIZ_OPTION_TEMPLATE = "- {letter}) {option}\n"
+_QUIZ_ANSWER_TEMPLATE = "**Answer Explanation:**\n{explanation}"
+
+_CHALLENGE_TEMPLATE = """## 🚀 Challenge: {title}
+
+{description}
+
+{hints}"""
+_CHALLENGE_HINTS_HEADER = "\n**Hints:**\n"
+_CHALLENGE_HINT_TEMPLATE = "- Hint {number}: {hint}\n"
+
+_VISUAL_EXERCISE_TEMPLATE = """## 🎨 Visual Exercise: {title}
+
+{description}
+
+"""
+_ASCII_ART_EXAMPLE = '''
+# Example ASCII Art - Modify this!
+print("""
+    ~~~~ Fun Program ~~~~
+    🎉 Learning is Fun! 🎉
+""")
+'''
+
+_FUN_FACT_TEMPLATE = """### 💡 Did You Know?
+
+{fact}
+"""
+
+_INTRO_META_TEMPLATE = """
+**Author:** {author}  
+**Created:** {created}  
+**Topic:** {topic}
+"""
+
+
+@lru_cache(maxsize=1)
+def _today_str(day_ordinal: int) -> str:
+    """Format a date for the intro cell, cached for the current day."""
+    return date.fromordinal(day_ordinal).strftime('%B %d, %Y')
+
+
+def _build_and_save(job: Tuple[Callable[[], 'NotebookGenerator'], str]) -> str:
+    """Build a notebook and save it; runs inside a worker process."""
+    build, filepath = job
+    return build().save(filepath)
 
 
 class NotebookGenerator:
-    \"\"\"Generate Jupyter notebooks from lesson templates and blocks.\"\"\"
+    """Generate Jupyter notebooks from lesson templates and blocks."""
     
     NOTEBOOK_VERSION = 4
     MIMETYPE_CODE = "code"
     MIMETYPE_MARKDOWN = "markdown"
     MIMETYPE_RAW = "raw"
+    NOTEBOOK_VERSION_MINOR = 4
+    
+    # Notebook-level metadata shared by every generated notebook (read-only)
+    _DEFAULT_METADATA = MappingProxyType({
+        "kernelspec": MappingProxyType({
+            "display_name": "Python 3",
+            "language": "python",
+            "name": "python3"
+        }),
+        "language_info": MappingProxyType({
+            "name": "python",
+            "version": "3.9.0"
+        })
+    })
     
     def __init__(self, title: str, description: str = "", author: str = "Learning System"):
-        \"\"\"Initialize notebook generator with metadata.\"\"\"
+        """Initialize notebook generator with metadata."""
         self.title = title
         self.description = description
         self.author = author
-        self.cells = []
-        self.metadata = {
-            "kernelspec": {
-                "display_name": "Python 3",
-                "language": "python",
-                "name": "python3"
-            },
-            "language_info": {
-                "name": "python",
-                "version": "3.9.0"
-            }
-        }
+        self.cells: deque = deque()
+        # Copy one level deep so callers can adjust their notebook's metadata
+        self.metadata = {key: dict(value) for key, value in self._DEFAULT_METADATA.items()}
+    
+    def add_cells(self, cells: Iterable[Dict[str, Any]]) -> 'NotebookGenerator':
+        """Add several prebuilt cells (see ``_create_cell``) in one call."""
+        self.cells.extend(cells)
+        return self
     
     def add_markdown_cell(self, content: str, tags: Optional[List[str]] = None) -> 'NotebookGenerator':
-        \"\"\"Add a markdown cell to the notebook.\"\"\"
+        """Add a markdown cell to the notebook."""
         cell = self._create_cell(
             cell_type="markdown",
             source=content,
@@ -49,7 +127,7 @@ class NotebookGenerator:
     
     def add_code_cell(self, code: str, tags: Optional[List[str]] = None, 
                      execution_count: Optional[int] = None) -> 'NotebookGenerator':
-        \"\"\"Add a Python code cell to the notebook.\"\"\"
+        """Add a Python code cell to the notebook."""
         cell = self._create_cell(
             cell_type="code",
             source=code,
@@ -61,86 +139,73 @@ class NotebookGenerator:
     
     def add_quiz_cell(self, question: str, options: List[str], correct_index: int,
                      explanation: str = "") -> 'NotebookGenerator':
-        \"\"\"Add an interactive quiz cell (markdown with code hook).\"\"\"
-        quiz_content = f\"\"\"## 🎯 Quiz Question
-
-**{question}**
-
-\"\"\"
-        for i, option in enumerate(options):
-            quiz_content += f\"- {chr(65 + i)}) {option}\\n\"
+        """Add an interactive quiz cell (markdown with code hook)."""
+        if len(options) > len(_OPTION_LETTERS):
+            raise ValueError(f"A quiz can have at most {len(_OPTION_LETTERS)} options")
+        
+        options_md = "".join(
+            _QUIZ_OPTION_TEMPLATE.format(letter=letter, option=option)
+            for letter, option in zip(_OPTION_LETTERS, options)
+        )
         
-        self.add_markdown_cell(quiz_content, tags=["quiz"])
+        quiz_content = _QUIZ_TEMPLATE.format(question=question, options=options_md)
+        self.add_markdown_cell(quiz_content, tags=[TAG_QUIZ])
         
         if explanation:
-            self.add_markdown_cell(f\"**Answer Explanation:**\\n{explanation}\", tags=[\"quiz-answer\"])
+            self.add_markdown_cell(_QUIZ_ANSWER_TEMPLATE.format(explanation=explanation),
+                                   tags=[TAG_QUIZ_ANSWER])
         
         return self
     
     def add_challenge_cell(self, challenge_title: str, description: str,
                           starter_code: str = "", hints: Optional[List[str]] = None) -> 'NotebookGenerator':
-        \"\"\"Add a code challenge cell with hints.\"\"\"
-        content = f\"\"\"## 🚀 Challenge: {challenge_title}
-
-{description}
-
-\"\"\"
+        """Add a code challenge cell with hints."""
+        hints_md = ""
         if hints:
-            content += \"\\n**Hints:**\\n\"
-            for i, hint in enumerate(hints, 1):
-                content += f\"- Hint {i}: {hint}\\n\"
+            hints_md = _CHALLENGE_HINTS_HEADER + "".join(
+                _CHALLENGE_HINT_TEMPLATE.format(number=i, hint=hint)
+                for i, hint in enumerate(hints, 1)
+            )
         
-        self.add_markdown_cell(content, tags=["challenge"])
+        content = _CHALLENGE_TEMPLATE.format(title=challenge_title, description=description,
+                                             hints=hints_md)
+        self.add_markdown_cell(content, tags=[TAG_CHALLENGE])
         
         if starter_code:
-            self.add_code_cell(starter_code, tags=["challenge-code"])
+            self.add_code_cell(starter_code, tags=[TAG_CHALLENGE_CODE])
         else:
-            self.add_code_cell("# Write your code here", tags=["challenge-code"])
+            self.add_code_cell("# Write your code here", tags=[TAG_CHALLENGE_CODE])
         
         return self
     
     def add_visual_exercise(self, title: str, description: str,
                            visual_type: str = "ascii_art") -> 'NotebookGenerator':
-        \"\"\"Add a visual/interactive exercise cell.\"\"\"
-        content = f\"\"\"## 🎨 Visual Exercise: {title}
-
-{description}
-
-\"\"\"
-        self.add_markdown_cell(content, tags=["visual-exercise"])
+        """Add a visual/interactive exercise cell."""
+        content = _VISUAL_EXERCISE_TEMPLATE.format(title=title, description=description)
+        self.add_markdown_cell(content, tags=[TAG_VISUAL_EXERCISE])
         
         if visual_type == "ascii_art":
-            example = '''
-# Example ASCII Art - Modify this!
-print(\"\"\"
-    ~~~~ Fun Program ~~~~
-    🎉 Learning is Fun! 🎉
-\"\"\")
-'''
-            self.add_code_cell(example, tags=["visual-code"])
+            self.add_code_cell(_ASCII_ART_EXAMPLE, tags=[TAG_VISUAL_CODE])
         
         return self
     
     def add_fun_fact(self, fact: str) -> 'NotebookGenerator':
-        \"\"\"Add a fun fact or learning nugget.\"\"\"
-        content = f\"\"\"### 💡 Did You Know?
-
-{fact}
-\"\"\"
-        self.add_markdown_cell(content, tags=["fun-fact"])
+        """Add a fun fact or learning nugget."""
+        content = _FUN_FACT_TEMPLATE.format(fact=fact)
+        self.add_markdown_cell(content, tags=[TAG_FUN_FACT])
         return self
     
     def set_title_and_intro(self, title: str, introduction: str) -> 'NotebookGenerator':
-        \"\"\"Add a title and introduction to the notebook.\"\"\"
+        """Add a title and introduction to the notebook."""
         # Title
-        self.add_markdown_cell(f\"# {title}\")
+        self.add_markdown_cell(f"# {title}")
         
         # Metadata
-        meta = f\"\"\"
-**Author:** {self.author}  
-**Created:** {datetime.now().strftime('%B %d, %Y')}  
-**Topic:** {self.title}
-\"\"\"
+        meta = _INTRO_META_TEMPLATE.format(
+            author=self.author,
+            created=_today_str(date.today().toordinal()),
+            topic=self.title,
+        )
         self.add_markdown_cell(meta)
         
         # Introduction
@@ -149,40 +214,69 @@ print(\"\"\"
         return self
     
     def generate(self) -> Dict[str, Any]:
-        \"\"\"Generate the complete notebook as a dictionary.\"\"\"
+        """Generate the complete notebook as a dictionary."""
         notebook = {
-            "cells": self.cells,
+            "cells": list(self.cells),
             "metadata": self.metadata,
             "nbformat": self.NOTEBOOK_VERSION,
-            "nbformat_minor": 4
+            "nbformat_minor": self.NOTEBOOK_VERSION_MINOR
         }
         return notebook
     
     def save(self, filepath: str) -> str:
-        \"\"\"Save the notebook to a file.\"\"\"
+        """Save the notebook to a file."""
         notebook = self.generate()
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=2)
+        if _jsonio.orjson is not None:
+            # Notebooks are small enough that encoding in memory and issuing
+            # a single write beats streaming
+            path.write_bytes(_jsonio.dumps(notebook))
+        else:
+            # Stream encoded chunks through a large buffer instead of
+            # building the whole JSON document as one string
+            with open(path, 'wb', buffering=_jsonio.WRITE_BUFFER_SIZE) as f:
+                for chunk in _jsonio.ENCODER.iterencode(notebook):
+                    f.write(chunk.encode('utf-8'))
         
         return str(path.absolute())
     
+    @classmethod
+    def save_many(cls, builders: List[Callable[[], 'NotebookGenerator']],
+                  filepaths: List[str], workers: Optional[int] = None) -> List[str]:
+        """Build and save several notebooks in parallel worker processes.
+        
+        Each builder is a picklable (module-level) callable returning a
+        NotebookGenerator; its notebook is saved to the matching filepath.
+        ``workers`` is passed to ProcessPoolExecutor, which defaults to the
+        number of CPUs.
+        """
+        if len(builders) != len(filepaths):
+            raise ValueError("builders and filepaths must have the same length")
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_build_and_save, zip(builders, filepaths)))
+    
     def to_json(self) -> str:
-        \"\"\"Export notebook as JSON string.\"\"\"
-        return json.dumps(self.generate(), indent=2)
+        """Export notebook as JSON string."""
+        return _jsonio.dumps(self.generate()).decode('utf-8')
     
     @staticmethod
     def _create_cell(cell_type: str, source: str, tags: List[str] = None,
                     execution_count: Optional[int] = None) -> Dict[str, Any]:
-        \"\"\"Create a cell structure compatible with Jupyter notebook format.\"\"\"
+        """Create a cell structure compatible with Jupyter notebook format.
+        
+        Tags should be str, as the notebook format requires; str tags are
+        interned so cells share one copy of each, anything else is stored
+        unchanged.
+        """
         cell = {
             "cell_type": cell_type,
             "metadata": {
-                "tags": tags or []
+                "tags": [sys.intern(tag) if type(tag) is str else tag for tag in tags] if tags else []
             },
-            "source": source.split('\\n') if isinstance(source, str) else source,
+            "source": source.splitlines(keepends=True) if isinstance(source, str) else source,
         }
         
         if cell_type == "code":
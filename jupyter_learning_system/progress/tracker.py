@@ -1,24 +1,52 @@
-﻿\"\"\"
+﻿"""
 ProgressTracker: Tracks student progress, completion status, and learning achievements.
-\"\"\"
+"""
 
-from typing import Dict, List, Any
-from dataclasses import dataclass, field
+from typing import Dict, Any, Callable, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-import json
+import os
+import sys
+import time
 from pathlib import Path
 
+from jupyter_learning_system._jsonio import WRITE_BUFFER_SIZE, dumps
 
-@dataclass
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Version tag written into save_binary checkpoints
+_BINARY_FORMAT_VERSION = 1
+
+# LessonProgress fields stored as epoch seconds and exported as ISO 8601
+_TIMESTAMP_FIELDS = ("started_at", "completed_at")
+# LessonProgress fields stored as sets and exported as sorted lists
+_SET_FIELDS = ("challenges_completed",)
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    """Convert epoch seconds to a local ISO 8601 string."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+@dataclass(slots=True)
 class LessonProgress:
-    \"\"\"Tracks progress on a single lesson.\"\"\"
+    """Tracks progress on a single lesson.
+    
+    Timestamps are epoch seconds (``time.time()``) and are only formatted
+    as ISO 8601 strings when exported.
+    """
     lesson_id: str
     lesson_title: str
-    started_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    completed_at: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+    completed_at: Optional[float] = None
     completion_percentage: int = 0
     quiz_score: Optional[int] = None
-    challenges_completed: List[str] = field(default_factory=list)
+    challenges_completed: Set[str] = field(default_factory=set)
     time_spent_minutes: int = 0
     
     @property
@@ -26,103 +54,305 @@ class LessonProgress:
         return self.completion_percentage >= 100
 
 
+def _make_to_dict(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Generate a ``to_dict`` that reads each dataclass field by name.
+    
+    The schema is fixed once the class exists, so the function is built a
+    single time as one dict literal instead of walking fields() per call.
+    """
+    items = []
+    for f in fields(cls):
+        if f.name in _TIMESTAMP_FIELDS:
+            expr = f"_isoformat(self.{f.name})"
+        elif f.name in _SET_FIELDS:
+            expr = f"sorted(self.{f.name})"
+        else:
+            expr = f"self.{f.name}"
+        items.append(f"{f.name!r}: {expr}")
+    
+    source = "def to_dict(self):\n    return {" + ", ".join(items) + "}\n"
+    namespace = {"_isoformat": _isoformat}
+    exec(source, namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__name__}.to_dict"
+    return to_dict
+
+
+LessonProgress.to_dict = _make_to_dict(LessonProgress)
+
+
+def _pack_default(obj: Any) -> Any:
+    """msgpack ``default`` hook; keeps timestamps as epoch seconds."""
+    if isinstance(obj, LessonProgress):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise ImportError("msgpack is required for binary progress files; install it with 'pip install msgpack'")
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a file with raw os-level calls, bypassing file objects."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 class ProgressTracker:
-    \"\"\"Tracks overall student progress and achievements.\"\"\"
+    """Tracks overall student progress and achievements."""
+    
+    # Absolute paths of output directories already created by this process
+    _created_dirs: Set[str] = set()
     
     def __init__(self, student_name: str):
         self.student_name = student_name
         self.lesson_progress: Dict[str, LessonProgress] = {}
         self.total_points: int = 0
-        self.badges_earned: List[str] = []
+        self.badges_earned: Set[str] = set()
         self.created_at = datetime.now().isoformat()
+        # Running aggregates behind get_progress_summary, kept up to date by
+        # the mutators below (update progress through them, not directly)
+        self._completed_lessons: int = 0
+        self._total_time_minutes: int = 0
+        self._quiz_score_sum: int = 0
+        self._quiz_score_count: int = 0
+        # What each lesson last added to the aggregates, as (completed,
+        # minutes, quiz score), so it is subtracted exactly even if the
+        # lesson's fields were edited directly in between
+        self._contributions: Dict[str, Tuple[bool, int, Optional[int]]] = {}
     
     def start_lesson(self, lesson_id: str, lesson_title: str) -> LessonProgress:
-        \"\"\"Mark a lesson as started.\"\"\"
+        """Mark a lesson as started.
+        
+        Lesson IDs and titles must be str; they are interned so trackers for
+        many students share one copy of each catalog string.
+        """
+        lesson_id = sys.intern(lesson_id)
         progress = LessonProgress(
             lesson_id=lesson_id,
-            lesson_title=lesson_title
+            lesson_title=sys.intern(lesson_title)
         )
+        self._remove_from_aggregates(lesson_id)
         self.lesson_progress[lesson_id] = progress
         return progress
     
     def complete_lesson(self, lesson_id: str, completion_percentage: int = 100,
                        quiz_score: Optional[int] = None) -> None:
-        \"\"\"Mark a lesson as completed.\"\"\"
+        """Mark a lesson as completed."""
         if lesson_id not in self.lesson_progress:
             raise ValueError(f"Lesson {lesson_id} not started yet")
         
         progress = self.lesson_progress[lesson_id]
+        self._remove_from_aggregates(lesson_id)
         progress.completion_percentage = completion_percentage
-        progress.completed_at = datetime.now().isoformat()
+        progress.completed_at = time.time()
         if quiz_score is not None:
             progress.quiz_score = quiz_score
+        self._add_to_aggregates(lesson_id, progress)
     
     def update_time_spent(self, lesson_id: str, minutes: int) -> None:
-        \"\"\"Update time spent on a lesson.\"\"\"
+        """Update time spent on a lesson."""
         if lesson_id in self.lesson_progress:
-            self.lesson_progress[lesson_id].time_spent_minutes += minutes
+            progress = self.lesson_progress[lesson_id]
+            self._remove_from_aggregates(lesson_id)
+            progress.time_spent_minutes += minutes
+            self._add_to_aggregates(lesson_id, progress)
     
     def add_challenge_completion(self, lesson_id: str, challenge_id: str) -> None:
-        \"\"\"Record completion of a code challenge.\"\"\"
+        """Record completion of a code challenge."""
         if lesson_id in self.lesson_progress:
-            if challenge_id not in self.lesson_progress[lesson_id].challenges_completed:
-                self.lesson_progress[lesson_id].challenges_completed.append(challenge_id)
+            self.lesson_progress[lesson_id].challenges_completed.add(sys.intern(challenge_id))
     
-    def add_points(self, points: int, reason: str = \"\") -> None:
-        \"\"\"Add gamification points.\"\"\"
+    def add_points(self, points: int, reason: str = "") -> None:
+        """Add gamification points."""
         self.total_points += points
     
     def award_badge(self, badge_name: str) -> None:
-        \"\"\"Award a badge to the student.\"\"\"
+        """Award a badge to the student."""
         if badge_name not in self.badges_earned:
-            self.badges_earned.append(badge_name)
+            self.badges_earned.add(sys.intern(badge_name))
     
     def get_progress_summary(self) -> Dict[str, Any]:
-        \"\"\"Get an overview of student progress.\"\"\"
-        completed_lessons = sum(1 for p in self.lesson_progress.values() if p.is_completed)
-        total_time = sum(p.time_spent_minutes for p in self.lesson_progress.values())
+        """Get an overview of student progress."""
         avg_quiz_score = None
-        
-        quiz_scores = [p.quiz_score for p in self.lesson_progress.values() if p.quiz_score]
-        if quiz_scores:
-            avg_quiz_score = sum(quiz_scores) / len(quiz_scores)
+        if self._quiz_score_count:
+            avg_quiz_score = self._quiz_score_sum / self._quiz_score_count
         
         return {
-            \"student_name\": self.student_name,
-            \"total_lessons_started\": len(self.lesson_progress),
-            \"total_lessons_completed\": completed_lessons,
-            \"total_points\": self.total_points,
-            \"total_time_minutes\": total_time,
-            \"average_quiz_score\": avg_quiz_score,
-            \"badges_earned\": len(self.badges_earned),
-            \"badges\": self.badges_earned,
+            "student_name": self.student_name,
+            "total_lessons_started": len(self.lesson_progress),
+            "total_lessons_completed": self._completed_lessons,
+            "total_points": self.total_points,
+            "total_time_minutes": self._total_time_minutes,
+            "average_quiz_score": avg_quiz_score,
+            "badges_earned": len(self.badges_earned),
+            "badges": sorted(self.badges_earned),
         }
     
-    def export_progress(self, filepath: str) -> str:
-        \"\"\"Export progress to JSON.\"\"\"
-        progress_data = {
-            \"student_name\": self.student_name,
-            \"created_at\": self.created_at,
-            \"summary\": self.get_progress_summary(),
-            \"lesson_progress\": {
-                lid: {
-                    \"lesson_id\": p.lesson_id,
-                    \"lesson_title\": p.lesson_title,
-                    \"started_at\": p.started_at,
-                    \"completed_at\": p.completed_at,
-                    \"completion_percentage\": p.completion_percentage,
-                    \"quiz_score\": p.quiz_score,
-                    \"challenges_completed\": p.challenges_completed,
-                    \"time_spent_minutes\": p.time_spent_minutes,
-                }
-                for lid, p in self.lesson_progress.items()
-            }
+    def _add_to_aggregates(self, lesson_id: str, progress: LessonProgress) -> None:
+        """Count a lesson's current progress in the running aggregates."""
+        completed = progress.is_completed
+        minutes = progress.time_spent_minutes
+        quiz_score = progress.quiz_score
+        self._contributions[lesson_id] = (completed, minutes, quiz_score)
+        if completed:
+            self._completed_lessons += 1
+        self._total_time_minutes += minutes
+        if quiz_score is not None:
+            self._quiz_score_sum += quiz_score
+            self._quiz_score_count += 1
+    
+    def _remove_from_aggregates(self, lesson_id: str) -> None:
+        """Subtract what _add_to_aggregates last counted for a lesson, if anything."""
+        contribution = self._contributions.pop(lesson_id, None)
+        if contribution is None:
+            return
+        completed, minutes, quiz_score = contribution
+        if completed:
+            self._completed_lessons -= 1
+        self._total_time_minutes -= minutes
+        if quiz_score is not None:
+            self._quiz_score_sum -= quiz_score
+            self._quiz_score_count -= 1
+    
+    def save_binary(self, filepath: str) -> str:
+        """Save the full tracker state as a MessagePack checkpoint.
+        
+        This is the compact format for saving and restoring trackers; use
+        export_progress for human-readable JSON.
+        """
+        _require_msgpack()
+        state = {
+            "format_version": _BINARY_FORMAT_VERSION,
+            "student_name": self.student_name,
+            "created_at": self.created_at,
+            "total_points": self.total_points,
+            "badges_earned": self.badges_earned,
+            "lesson_progress": list(self.lesson_progress.values()),
         }
         
+        data = msgpack.packb(state, default=_pack_default, use_bin_type=True)
         path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(progress_data, f, indent=2)
+        self._write_in_dir(path, lambda p: _write_bytes(p, data))
+        return str(path.absolute())
+    
+    @classmethod
+    def load_binary(cls, filepath: str) -> 'ProgressTracker':
+        """Restore a tracker saved with save_binary."""
+        _require_msgpack()
+        state = msgpack.unpackb(Path(filepath).read_bytes(), raw=False)
+        if state.get("format_version") != _BINARY_FORMAT_VERSION:
+            raise ValueError(f"Unsupported progress file version: {state.get('format_version')}")
         
+        tracker = cls(state["student_name"])
+        tracker.created_at = state["created_at"]
+        tracker.total_points = state["total_points"]
+        tracker.badges_earned = {sys.intern(name) for name in state["badges_earned"]}
+        for data in state["lesson_progress"]:
+            data["lesson_id"] = sys.intern(data["lesson_id"])
+            data["lesson_title"] = sys.intern(data["lesson_title"])
+            data["challenges_completed"] = {sys.intern(c) for c in data["challenges_completed"]}
+            progress = LessonProgress(**data)
+            tracker.lesson_progress[progress.lesson_id] = progress
+            tracker._add_to_aggregates(progress.lesson_id, progress)
+        return tracker
+    
+    def export_progress(self, filepath: str, pretty: bool = True) -> str:
+        """Export progress to JSON (compact when ``pretty`` is False)."""
+        path = Path(filepath)
+        self._write_in_dir(path, lambda p: self._write_export(p, pretty))
         return str(path.absolute())
+    
+    @classmethod
+    def export_many(cls, trackers: Iterable['ProgressTracker'], directory: str,
+                    pretty: bool = True) -> List[str]:
+        """Export several trackers into one directory as <student_name>.json.
+        
+        Characters other than letters, digits, ``-`` and ``_`` become ``_``.
+        Raises ValueError, before writing anything, if a student name is
+        empty or two names map to the same file.
+        """
+        out_dir = Path(directory)
+        
+        jobs = []
+        # Compared case-insensitively so no file is overwritten on
+        # case-insensitive filesystems either
+        seen: Dict[str, str] = {}
+        for tracker in trackers:
+            name = tracker.student_name
+            if not name:
+                raise ValueError("Cannot export a tracker with an empty student name")
+            safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+            key = safe_name.casefold()
+            if key in seen:
+                raise ValueError(
+                    f"Students {seen[key]!r} and {name!r} would both be exported to {safe_name}.json"
+                )
+            seen[key] = name
+            jobs.append((tracker, out_dir / f"{safe_name}.json"))
+        
+        paths = []
+        for tracker, path in jobs:
+            cls._write_in_dir(path, lambda p: tracker._write_export(p, pretty))
+            paths.append(str(path.absolute()))
+        return paths
+    
+    @classmethod
+    def _write_in_dir(cls, path: Path, write: Callable[[Path], None]) -> None:
+        """Run ``write(path)``, creating the parent directory if needed.
+        
+        The mkdir call is skipped for directories already created by this
+        process; if one has since been removed, it is recreated and the
+        write is retried once.
+        """
+        directory = path.parent
+        # abspath is pure string handling, unlike resolve() which stats the path
+        key = os.path.abspath(directory)
+        if key not in cls._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            cls._created_dirs.add(key)
+        try:
+            write(path)
+        except FileNotFoundError:
+            cls._created_dirs.discard(key)
+            directory.mkdir(parents=True, exist_ok=True)
+            cls._created_dirs.add(key)
+            write(path)
+    
+    def _write_export(self, path: Path, pretty: bool) -> None:
+        """Stream the progress export to a file in an existing directory.
+        
+        Lessons are encoded and written one at a time so peak memory does
+        not grow with the number of lessons; the output is identical to
+        encoding the whole export in one go.
+        """
+        header = dumps({
+            "student_name": self.student_name,
+            "created_at": self.created_at,
+            "summary": self.get_progress_summary(),
+        }, pretty)
+        if pretty:
+            newline, key_sep = b'\n    ', b': '
+            open_lessons = b',\n  "lesson_progress": {'
+            close_lessons = b'\n  }\n}' if self.lesson_progress else b'}\n}'
+        else:
+            newline, key_sep = b'', b':'
+            open_lessons, close_lessons = b',"lesson_progress":{', b'}}'
+        
+        with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            # Reopen the header object by dropping its closing brace
+            f.write(header[:header.rindex(b'}')].rstrip() + open_lessons)
+            for i, (lesson_id, progress) in enumerate(self.lesson_progress.items()):
+                if i:
+                    f.write(b',')
+                f.write(newline + dumps(lesson_id, pretty) + key_sep
+                        + dumps(progress, pretty).replace(b'\n', newline))
+            f.write(close_lessons)
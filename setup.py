@@ -10,13 +10,20 @@ setup(
     description="Educational Jupyter notebook generation system for children",
     author="Justin Crawford",
     author_email="",
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     packages=find_packages(),
     install_requires=[
         "jupyter>=1.0.0",
         "click>=8.0.0",
         "nbformat>=5.0.0",
     ],
+    extras_require={
+        # Optional C-accelerated JSON export and binary progress checkpoints
+        "fast": [
+            "orjson>=3.9",
+            "msgpack>=1.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "jupyter-learning=jupyter_learning_system.cli.main:cli",
@@ -26,8 +33,6 @@ setup(
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Education",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
     ],
 )
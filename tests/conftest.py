@@ -0,0 +1,14 @@
+import pytest
+
+from jupyter_learning_system import _jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib encoders."""
+    if request.param == "orjson":
+        if _jsonio.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(_jsonio, "orjson", None)
+    return request.param
@@ -0,0 +1,197 @@
+"""Tests for CurriculumManager."""
+
+import json
+
+import pytest
+
+from jupyter_learning_system._jsonio import dumps
+from jupyter_learning_system.curriculum.curriculum_manager import (
+    CurriculumManager,
+    Lesson,
+    LevelDifficulty,
+    Module,
+)
+
+
+def make_lesson(lesson_id, topic="basics", difficulty=LevelDifficulty.BEGINNER,
+                prerequisites=()):
+    return Lesson(
+        id=lesson_id,
+        title=lesson_id.title(),
+        description=f"About {lesson_id}",
+        topic=topic,
+        difficulty=difficulty,
+        prerequisites=list(prerequisites),
+    )
+
+
+def make_curriculum(*lessons):
+    curriculum = CurriculumManager()
+    curriculum.create_module("main", "Main", "")
+    for lesson in lessons:
+        curriculum.add_lesson("main", lesson)
+    return curriculum
+
+
+def export(curriculum, tmp_path):
+    path = curriculum.export_curriculum(str(tmp_path / "out" / "curriculum.json"))
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_export_curriculum(tmp_path, encoder):
+    curriculum = CurriculumManager("Python für Kinder")
+    curriculum.create_module("basics", "Basics", "First steps 🐍")
+    curriculum.add_lesson("basics", Lesson(
+        id="loops",
+        title="Loops",
+        description="Repeating things",
+        topic="control_flow",
+        difficulty=LevelDifficulty.INTERMEDIATE,
+        estimated_duration_minutes=20,
+        prerequisites=["variables"],
+        learning_outcomes=["Write a for loop"],
+        tags=["intro"],
+        gamification_points=150,
+    ))
+    curriculum.create_module("later", "Coming soon", "")
+
+    assert export(curriculum, tmp_path) == {
+        "name": "Python für Kinder",
+        "modules": {
+            "basics": {
+                "title": "Basics",
+                "description": "First steps 🐍",
+                "lessons": [{
+                    "id": "loops",
+                    "title": "Loops",
+                    "description": "Repeating things",
+                    "topic": "control_flow",
+                    "difficulty": "INTERMEDIATE",
+                    "estimated_duration_minutes": 20,
+                    "prerequisites": ["variables"],
+                    "learning_outcomes": ["Write a for loop"],
+                    "tags": ["intro"],
+                    "gamification_points": 150,
+                }],
+            },
+            "later": {"title": "Coming soon", "description": "", "lessons": []},
+        },
+    }
+
+
+def test_export_empty_curriculum(tmp_path, encoder):
+    assert export(CurriculumManager("Empty"), tmp_path) == {"name": "Empty", "modules": {}}
+
+
+def test_export_curriculum_writes_module_ids_as_strings(tmp_path, encoder):
+    curriculum = CurriculumManager("Numbered")
+    curriculum.create_module(1, "One", "")
+
+    assert list(export(curriculum, tmp_path)["modules"]) == ["1"]
+
+
+def test_learning_path_lists_prerequisites_first_in_declaration_order():
+    curriculum = make_curriculum(
+        make_lesson("variables"),
+        make_lesson("printing"),
+        make_lesson("loops", prerequisites=["variables", "printing"]),
+        make_lesson("functions", prerequisites=["loops", "variables"]),
+    )
+
+    assert curriculum.get_learning_path("functions") == [
+        "variables", "printing", "loops", "functions",
+    ]
+
+
+def test_learning_path_includes_unknown_prerequisites():
+    curriculum = make_curriculum(make_lesson("loops", prerequisites=["setup"]))
+
+    assert curriculum.get_learning_path("loops") == ["setup", "loops"]
+
+
+def test_learning_path_stops_at_cycles():
+    curriculum = make_curriculum(
+        make_lesson("a", prerequisites=["b"]),
+        make_lesson("b", prerequisites=["a"]),
+    )
+
+    assert curriculum.get_learning_path("a") == ["b", "a"]
+
+
+def test_learning_path_handles_chains_deeper_than_the_recursion_limit():
+    depth = 5000
+    curriculum = make_curriculum(*(
+        make_lesson(f"l{i}", prerequisites=[f"l{i - 1}"] if i else [])
+        for i in range(depth)
+    ))
+
+    assert curriculum.get_learning_path(f"l{depth - 1}") == [f"l{i}" for i in range(depth)]
+
+
+def test_filters_return_lessons_in_insertion_order():
+    curriculum = make_curriculum(
+        make_lesson("variables"),
+        make_lesson("loops", topic="control_flow", difficulty=LevelDifficulty.INTERMEDIATE),
+        make_lesson("printing"),
+    )
+
+    assert [l.id for l in curriculum.get_lessons_by_topic("basics")] == ["variables", "printing"]
+    assert [l.id for l in curriculum.get_lessons_by_difficulty(LevelDifficulty.INTERMEDIATE)] == ["loops"]
+    assert curriculum.get_lessons_by_topic("unknown") == []
+
+
+def test_filters_drop_a_replaced_lesson():
+    curriculum = make_curriculum(make_lesson("loops"))
+    curriculum.add_lesson("main", make_lesson(
+        "loops", topic="control_flow", difficulty=LevelDifficulty.ADVANCED))
+
+    assert curriculum.get_lessons_by_topic("basics") == []
+    assert curriculum.get_lessons_by_difficulty(LevelDifficulty.BEGINNER) == []
+    assert [l.topic for l in curriculum.get_lessons_by_topic("control_flow")] == ["control_flow"]
+    assert len(curriculum.get_lessons_by_difficulty(LevelDifficulty.ADVANCED)) == 1
+
+
+def test_filter_results_are_copies():
+    curriculum = make_curriculum(make_lesson("loops"))
+    curriculum.get_lessons_by_topic("basics").clear()
+
+    assert len(curriculum.get_lessons_by_topic("basics")) == 1
+
+
+def test_modules_and_lessons_encode_through_the_default_hook(encoder):
+    module = Module("basics", "Basics", "First steps").add_lesson(
+        make_lesson("loops", prerequisites=["variables"]))
+
+    assert json.loads(dumps({"modules": [module]})) == {"modules": [{
+        "title": "Basics",
+        "description": "First steps",
+        "lessons": [{
+            "id": "loops",
+            "title": "Loops",
+            "description": "About loops",
+            "topic": "basics",
+            "difficulty": "BEGINNER",
+            "estimated_duration_minutes": 15,
+            "prerequisites": ["variables"],
+            "learning_outcomes": [],
+            "tags": [],
+            "gamification_points": 100,
+        }],
+    }]}
+
+
+def test_unknown_objects_are_not_encoded(encoder):
+    with pytest.raises(TypeError):
+        dumps({"lesson": object()})
+
+
+def test_in_and_indexing_by_lesson_id():
+    lesson = make_lesson("loops")
+    curriculum = make_curriculum(lesson)
+
+    assert "loops" in curriculum
+    assert "functions" not in curriculum
+    assert curriculum["loops"] is lesson
+    with pytest.raises(KeyError):
+        curriculum["functions"]
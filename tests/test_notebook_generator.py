@@ -0,0 +1,73 @@
+"""Tests for NotebookGenerator."""
+
+import json
+
+import pytest
+
+from jupyter_learning_system.generators.notebook_generator import NotebookGenerator
+
+
+def build_loops():
+    return NotebookGenerator("Loops").add_markdown_cell("# Loops")
+
+
+def build_functions():
+    return NotebookGenerator("Functions").add_code_cell("def f():\n    pass\n")
+
+
+def test_cell_source_keeps_line_endings():
+    notebook = NotebookGenerator("Loops")
+    notebook.add_code_cell("for i in range(3):\n    print(i)\n")
+
+    assert notebook.cells[-1]["source"] == ["for i in range(3):\n", "    print(i)\n"]
+
+
+def test_cell_source_without_trailing_newline():
+    notebook = NotebookGenerator("Loops")
+    notebook.add_markdown_cell("# Title\nText")
+
+    assert notebook.cells[-1]["source"] == ["# Title\n", "Text"]
+
+
+def test_quiz_letters_its_options():
+    notebook = NotebookGenerator("Quiz")
+    notebook.add_quiz_cell("Pick one", ["red", "green", "blue"], correct_index=1)
+
+    source = "".join(notebook.cells[-1]["source"])
+    assert source.endswith("- A) red\n- B) green\n- C) blue\n")
+
+
+def test_quiz_accepts_26_options():
+    notebook = NotebookGenerator("Quiz")
+    notebook.add_quiz_cell("Pick one", [str(i) for i in range(26)], correct_index=0)
+
+    assert notebook.cells[-1]["source"][-1] == "- Z) 25\n"
+
+
+def test_quiz_rejects_more_than_26_options():
+    notebook = NotebookGenerator("Quiz")
+
+    with pytest.raises(ValueError, match="at most 26 options"):
+        notebook.add_quiz_cell("Pick one", [str(i) for i in range(27)], correct_index=0)
+    assert not notebook.cells
+
+
+def test_save_many_saves_each_notebook_to_its_path(tmp_path):
+    paths = [str(tmp_path / "loops.ipynb"), str(tmp_path / "functions.ipynb")]
+
+    saved = NotebookGenerator.save_many([build_loops, build_functions], paths, workers=2)
+
+    assert saved == paths
+    for build, path in zip([build_loops, build_functions], paths):
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == json.loads(build().to_json())
+
+
+def test_save_many_requires_one_path_per_builder(tmp_path):
+    with pytest.raises(ValueError):
+        NotebookGenerator.save_many([build_loops], [])
+
+
+def test_save_many_rejects_zero_workers(tmp_path):
+    with pytest.raises(ValueError):
+        NotebookGenerator.save_many([build_loops], [str(tmp_path / "loops.ipynb")], workers=0)
@@ -0,0 +1,231 @@
+"""Tests for ProgressTracker."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from jupyter_learning_system.progress.tracker import ProgressTracker
+
+
+def make_tracker():
+    tracker = ProgressTracker("Zoë")
+    tracker.start_lesson("loops", "Loops 🔁")
+    tracker.update_time_spent("loops", 12)
+    tracker.add_challenge_completion("loops", "c2")
+    tracker.add_challenge_completion("loops", "c1")
+    tracker.complete_lesson("loops", quiz_score=80)
+    tracker.start_lesson("functions", "Functions")
+    tracker.add_points(150)
+    tracker.award_badge("first_steps")
+    return tracker
+
+
+def test_summary_counts_completed_lessons_time_and_quiz_scores():
+    tracker = ProgressTracker("Ada")
+    tracker.start_lesson("loops", "Loops")
+    tracker.start_lesson("functions", "Functions")
+    tracker.update_time_spent("loops", 10)
+    tracker.update_time_spent("functions", 5)
+    tracker.complete_lesson("loops", quiz_score=80)
+    tracker.complete_lesson("functions", completion_percentage=50, quiz_score=60)
+
+    summary = tracker.get_progress_summary()
+
+    assert summary["total_lessons_started"] == 2
+    assert summary["total_lessons_completed"] == 1
+    assert summary["total_time_minutes"] == 15
+    assert summary["average_quiz_score"] == 70
+
+
+def test_summary_after_editing_a_lesson_then_completing_it():
+    tracker = ProgressTracker("Ada")
+    progress = tracker.start_lesson("loops", "Loops")
+    progress.completion_percentage = 100
+    progress.quiz_score = 50
+
+    tracker.complete_lesson("loops", quiz_score=80)
+
+    summary = tracker.get_progress_summary()
+    assert summary["total_lessons_completed"] == 1
+    assert summary["average_quiz_score"] == 80
+
+
+def test_restarting_a_lesson_drops_its_previous_progress():
+    tracker = ProgressTracker("Ada")
+    progress = tracker.start_lesson("loops", "Loops")
+    tracker.update_time_spent("loops", 10)
+    tracker.complete_lesson("loops", quiz_score=80)
+    progress.completion_percentage = 0
+
+    tracker.start_lesson("loops", "Loops")
+
+    summary = tracker.get_progress_summary()
+    assert summary["total_lessons_started"] == 1
+    assert summary["total_lessons_completed"] == 0
+    assert summary["total_time_minutes"] == 0
+    assert summary["average_quiz_score"] is None
+
+
+def test_recompleting_a_lesson_counts_it_once():
+    tracker = ProgressTracker("Ada")
+    tracker.start_lesson("loops", "Loops")
+    tracker.complete_lesson("loops", quiz_score=40)
+    tracker.complete_lesson("loops", quiz_score=90)
+
+    summary = tracker.get_progress_summary()
+    assert summary["total_lessons_completed"] == 1
+    assert summary["average_quiz_score"] == 90
+
+
+def test_complete_lesson_requires_a_started_lesson():
+    with pytest.raises(ValueError):
+        ProgressTracker("Ada").complete_lesson("loops")
+
+
+def test_zero_quiz_score_counts_in_the_average():
+    tracker = ProgressTracker("Ada")
+    tracker.start_lesson("loops", "Loops")
+    tracker.start_lesson("functions", "Functions")
+    tracker.complete_lesson("loops", quiz_score=0)
+    tracker.complete_lesson("functions", quiz_score=100)
+
+    assert tracker.get_progress_summary()["average_quiz_score"] == 50
+
+
+def test_zero_quiz_score_alone_is_an_average_of_zero():
+    tracker = ProgressTracker("Ada")
+    tracker.start_lesson("loops", "Loops")
+    tracker.complete_lesson("loops", quiz_score=0)
+
+    assert tracker.get_progress_summary()["average_quiz_score"] == 0
+
+
+def test_binary_round_trip(tmp_path):
+    pytest.importorskip("msgpack")
+    tracker = make_tracker()
+    path = tracker.save_binary(str(tmp_path / "out" / "progress.msgpack"))
+
+    restored = ProgressTracker.load_binary(path)
+
+    assert restored.get_progress_summary() == tracker.get_progress_summary()
+    assert restored.lesson_progress == tracker.lesson_progress
+    assert restored.created_at == tracker.created_at
+    assert restored.badges_earned == {"first_steps"}
+    assert restored.lesson_progress["loops"].challenges_completed == {"c1", "c2"}
+
+
+def test_binary_round_trip_of_an_empty_tracker(tmp_path):
+    pytest.importorskip("msgpack")
+    tracker = ProgressTracker("Empty")
+    path = tracker.save_binary(str(tmp_path / "progress.msgpack"))
+
+    restored = ProgressTracker.load_binary(path)
+
+    assert restored.get_progress_summary() == tracker.get_progress_summary()
+    assert restored.lesson_progress == {}
+
+
+def test_restored_tracker_keeps_counting(tmp_path):
+    pytest.importorskip("msgpack")
+    path = make_tracker().save_binary(str(tmp_path / "progress.msgpack"))
+
+    restored = ProgressTracker.load_binary(path)
+    restored.complete_lesson("loops", quiz_score=60)
+    restored.complete_lesson("functions", quiz_score=100)
+
+    summary = restored.get_progress_summary()
+    assert summary["total_lessons_completed"] == 2
+    assert summary["total_time_minutes"] == 12
+    assert summary["average_quiz_score"] == 80
+
+
+def test_load_binary_rejects_other_format_versions(tmp_path):
+    msgpack = pytest.importorskip("msgpack")
+    path = tmp_path / "progress.msgpack"
+    path.write_bytes(msgpack.packb({"format_version": 99}))
+
+    with pytest.raises(ValueError, match="Unsupported progress file version"):
+        ProgressTracker.load_binary(str(path))
+
+
+def read_export(tracker, tmp_path, pretty):
+    path = tracker.export_progress(str(tmp_path / "out" / "progress.json"), pretty=pretty)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_export_progress(tmp_path, encoder, pretty):
+    tracker = make_tracker()
+    loops = tracker.lesson_progress["loops"]
+    loops.started_at = 1_700_000_000.0
+    loops.completed_at = 1_700_000_600.0
+    tracker.lesson_progress["functions"].started_at = 1_700_000_900.0
+
+    assert read_export(tracker, tmp_path, pretty) == {
+        "student_name": "Zoë",
+        "created_at": tracker.created_at,
+        "summary": {
+            "student_name": "Zoë",
+            "total_lessons_started": 2,
+            "total_lessons_completed": 1,
+            "total_points": 150,
+            "total_time_minutes": 12,
+            "average_quiz_score": 80,
+            "badges_earned": 1,
+            "badges": ["first_steps"],
+        },
+        "lesson_progress": {
+            "loops": {
+                "lesson_id": "loops",
+                "lesson_title": "Loops 🔁",
+                "started_at": datetime.fromtimestamp(1_700_000_000.0).isoformat(),
+                "completed_at": datetime.fromtimestamp(1_700_000_600.0).isoformat(),
+                "completion_percentage": 100,
+                "quiz_score": 80,
+                "challenges_completed": ["c1", "c2"],
+                "time_spent_minutes": 12,
+            },
+            "functions": {
+                "lesson_id": "functions",
+                "lesson_title": "Functions",
+                "started_at": datetime.fromtimestamp(1_700_000_900.0).isoformat(),
+                "completed_at": None,
+                "completion_percentage": 0,
+                "quiz_score": None,
+                "challenges_completed": [],
+                "time_spent_minutes": 0,
+            },
+        },
+    }
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_export_progress_of_an_empty_tracker(tmp_path, encoder, pretty):
+    tracker = ProgressTracker("Empty")
+
+    assert read_export(tracker, tmp_path, pretty) == {
+        "student_name": "Empty",
+        "created_at": tracker.created_at,
+        "summary": {
+            "student_name": "Empty",
+            "total_lessons_started": 0,
+            "total_lessons_completed": 0,
+            "total_points": 0,
+            "total_time_minutes": 0,
+            "average_quiz_score": None,
+            "badges_earned": 0,
+            "badges": [],
+        },
+        "lesson_progress": {},
+    }
+
+
+def test_pretty_export_is_indented_like_json_dump(tmp_path, encoder):
+    tracker = make_tracker()
+    path = tracker.export_progress(str(tmp_path / "progress.json"))
+
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    assert text == json.dumps(json.loads(text), indent=2, ensure_ascii=False)